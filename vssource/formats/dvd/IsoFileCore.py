@@ -6,7 +6,8 @@ import os
 import warnings
 from abc import abstractmethod
 from fractions import Fraction
-from itertools import count
+from functools import lru_cache
+from itertools import accumulate, count
 from tempfile import gettempdir
 from typing import Sequence, cast
 
@@ -27,6 +28,51 @@ __all__ = [
 ]
 
 
+def _scan_dir(path: SPath, ext: str) -> list[SPath]:
+    if not path.is_dir():
+        return []
+
+    with os.scandir(path) as entries:
+        return sorted(
+            SPath(entry.path) for entry in entries if entry.name.lower().endswith(ext) and entry.is_file()
+        )
+
+
+@lru_cache(maxsize=8)
+def _load_ifo_info(
+    iso_path: SPath, stat_sig: tuple[int, int], ifo_files: tuple[SPath, ...] = ()
+) -> tuple[IFO0, list[IFOX]] | None:
+    """
+    Parse the IFOs of a disc, either from the given files or through dvdsrc2.
+
+    ``stat_sig`` is only part of the cache key, so that a modified disc doesn't hit a stale entry.
+    The parsed IFO objects are shared by every instance opening the same disc and must be treated as read-only.
+    Returns None if dvdsrc2 is too old to read IFOs without mounting.
+    """
+
+    ifos: Sequence[SPathLike | bytes]
+
+    if ifo_files:
+        _ifo0p, *ifos = ifo_files
+        ifo0 = IFO0(SectorReadHelper(_ifo0p))
+    else:
+        def _getifo(i: int) -> bytes:
+            return cast(bytes, core.dvdsrc2.Ifo(str(iso_path), i))
+
+        _ifo0b = _getifo(0)
+
+        # remove in 2025
+        if len(_ifo0b) <= 30:
+            return None
+
+        ifo0 = IFO0(SectorReadHelper(_ifo0b))
+        ifos = [_getifo(i) for i in range(1, ifo0.num_vts + 1)]
+
+    ifo_info = (ifo0, [IFOX(SectorReadHelper(ifo)) for ifo in ifos])
+
+    return ifo_info
+
+
 class IsoFileCore:
     _subfolder = 'VIDEO_TS'
 
@@ -61,27 +107,20 @@ class IsoFileCore:
         if not self.iso_path.exists():
             raise CustomValueError('"path" needs to point to a .ISO or a dir root of DVD!', str(path), self.__class__)
 
-        ifo0: IFO0 | None = None
-        ifos: Sequence[SPathLike | bytes] = []
-        if indexer is None:
-            def _getifo(i: int) -> bytes:
-                return cast(bytes, core.dvdsrc2.Ifo(str(self.iso_path), i))
+        stat_sig = self._ifo_stat_sig()
 
-            _ifo0b = _getifo(0)
+        ifo_info: tuple[IFO0, list[IFOX]] | None = None
+        if indexer is None:
+            ifo_info = _load_ifo_info(self.iso_path, stat_sig)
 
-            # remove in 2025
-            if len(_ifo0b) <= 30:
+            if not ifo_info:
                 warnings.warn('Newer VapourSynth is required for dvdsrc2 information gathering without mounting!')
-            else:
-                ifo0 = IFO0(SectorReadHelper(_ifo0b))
-                ifos = [_getifo(i) for i in range(1, ifo0.num_vts + 1)]
 
-        if not ifo0:
-            _ifo0p, *ifos = self.ifo_files
-            ifo0 = IFO0(SectorReadHelper(_ifo0p))
+        if not ifo_info:
+            ifo_info = _load_ifo_info(self.iso_path, stat_sig, tuple(self.ifo_files))
 
-        self.ifo0 = ifo0
-        self.vts = [IFOX(SectorReadHelper(ifo)) for ifo in ifos]
+        # shared with every other instance of the same disc, read-only
+        self.ifo0, self.vts = cast(tuple[IFO0, list[IFOX]], ifo_info)
 
         self._double_check_json()
 
@@ -96,6 +135,16 @@ class IsoFileCore:
 
         self.title_count = len(self.ifo0.tt_srpt)
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop the IFO cache shared by all instances.
+
+        Nothing is kept on disk, so the next instance re-parses the disc from scratch.
+        """
+
+        _load_ifo_info.cache_clear()
+
     def get_vts(self, title_set_nr: int = 1, d2v_our_rff: bool = False) -> vs.VideoNode:
         """
         Gets a full vts.
@@ -152,18 +201,18 @@ class IsoFileCore:
 
         assert len(target_title) == tt.nr_of_ptts
 
-        for ptt in target_title[1:]:
-            if ptt.pgcn != target_title[0].pgcn:
-                warnings.warn('Title is not one program chain (currently untested)')
+        first_pgcn = target_title[0].pgcn
+
+        if any(ptt.pgcn != first_pgcn for ptt in target_title):
+            warnings.warn('Title is not one program chain (currently untested)')
 
         vobidcellids_to_take = list[tuple[int, int]]()
         is_chapter = list[bool]()
 
         i = 0
         while i < len(target_title):
-            ptt_to_take_for_pgc = len([
-                ppt for ppt in target_title[i:] if target_title[i].pgcn == ppt.pgcn
-            ])
+            current_pgcn = target_title[i].pgcn
+            ptt_to_take_for_pgc = sum(1 for ppt in target_title[i:] if ppt.pgcn == current_pgcn)
 
             assert ptt_to_take_for_pgc >= 1
 
@@ -221,10 +270,14 @@ class IsoFileCore:
         if not disable_rff:
             rnode = core.std.AssumeFPS(rnode, fpsnum=rfps.numerator, fpsden=rfps.denominator)
             durationcodes = [Fraction(rfps.denominator, rfps.numerator)] * len(rnode)
-            absolutetime = [a * (rfps.denominator / rfps.numerator) for a in range(len(rnode))]
+            frame_duration = rfps.denominator / rfps.numerator
+            absolutetime = [a * frame_duration for a in range(len(rnode))]
         else:
+            # rff is either 0 or 1, so there are only two possible durations
+            rff_durations = [Fraction(rfps.denominator * (a + 2), rfps.numerator * 2) for a in (0, 1)]
+
             if rff_mode == 1:
-                durationcodes = timecodes = [Fraction(rfps.denominator * (a + 2), rfps.numerator * 2) for a in rff]
+                durationcodes = timecodes = [rff_durations[a] for a in rff]
                 absolutetime = absolute_time_from_timecode(timecodes)
 
                 def _apply_timecodes(n: int, f: vs.VideoFrame) -> vs.VideoFrame:
@@ -238,7 +291,7 @@ class IsoFileCore:
 
                 rnode = rnode.std.ModifyFrame(rnode, _apply_timecodes)
             else:
-                rffcnt = len([a for a in rff if a])
+                rffcnt = sum(1 for a in rff if a)
 
                 asd = (rffcnt * 3 + 2 * (len(rff) - rffcnt)) / len(rff)
 
@@ -247,7 +300,7 @@ class IsoFileCore:
 
                 rnode = core.std.AssumeFPS(rnode, fpsnum=new_fps.numerator, fpsden=new_fps.denominator)
 
-                durationcodes = timecodes = [Fraction(rfps.denominator * (a + 2), rfps.numerator * 2) for a in rff]
+                durationcodes = timecodes = [rff_durations[a] for a in rff]
                 absolutetime = absolute_time_from_timecode(timecodes)
 
         changes = [
@@ -256,19 +309,10 @@ class IsoFileCore:
 
         assert len(changes) == len(is_chapter)
 
-        last_chapter_i = next((i for i, c in reversed(list(enumerate(is_chapter))) if c), 0)
-
-        output_chapters = list[int]()
-        for i in range(len(is_chapter)):
-            if not is_chapter[i]:
-                continue
+        # each chapter ends at the cell change before the next chapter, the last one at its own cell change
+        chapter_idxs = [i for i, c in enumerate(is_chapter) if c]
 
-            for j in range(i + 1, len(is_chapter)):
-                if is_chapter[j]:
-                    output_chapters.append(changes[j - 1])
-                    break
-            else:
-                output_chapters.append(changes[last_chapter_i])
+        output_chapters = [changes[j - 1] for j in chapter_idxs[1:]] + [changes[i] for i in chapter_idxs[-1:]]
 
         dvnavchapters = double_check_dvdnav(self.iso_path, title_idx + 1)
 
@@ -342,6 +386,22 @@ class IsoFileCore:
             audios, patched_end_chapter
         )
 
+    def _ifo_stat_sig(self) -> tuple[int, int]:
+        if self.iso_path.is_file():
+            stat = self.iso_path.stat()
+
+            return stat.st_size, stat.st_mtime_ns
+
+        # don't go through mount_path, it would normalize iso_path before it gets passed to dvdsrc2
+        if self.force_root or self.iso_path.name.upper() == self._subfolder:
+            folder = self.iso_path
+        else:
+            folder = self.iso_path / self._subfolder
+
+        stats = [f.stat() for f in _scan_dir(folder, '.ifo')]
+
+        return sum(stat.st_size for stat in stats), max((stat.st_mtime_ns for stat in stats), default=0)
+
     def _get_title_vob_files_for_vts(self, vts: int) -> Sequence[SPath]:
         return [
             vob for vob in self.vob_files
@@ -355,7 +415,6 @@ class IsoFileCore:
             target_vts = self.vts[tt.title_set_nr - 1]
             ptts = target_vts.vts_ptt_srpt[tt.vts_ttn - 1]
 
-            current_time = 0.0
             seconds = []
             vobids = []
             for a in ptts:
@@ -365,14 +424,13 @@ class IsoFileCore:
                 chap_time = target_pgc.cell_playback[cell_n - 1].playback_time.get_seconds_float()
                 vobid = target_pgc.cell_position[cell_n - 1]
 
-                current_time += chap_time
                 seconds += [chap_time]
                 vobids += [(vobid.vob_id_nr, vobid.cell_nr)]
             to_print += f'Title: {i + 1:02}\n'
             lastv = None
 
             crnt = 0
-            crnt_glbl = 0
+            starts_glbl = list(accumulate(seconds, initial=0.0))
             to_print += "  nbr vobid start localstart localend duration\n"
             for i, v in enumerate(vobids):
                 if lastv != v[0]:
@@ -381,13 +439,12 @@ class IsoFileCore:
                     crnt = 0
                     lastv = v[0]
                 sta = str(datetime.timedelta(seconds=crnt))
-                sta_g = str(datetime.timedelta(seconds=crnt_glbl))
+                sta_g = str(datetime.timedelta(seconds=starts_glbl[i]))
                 end = str(datetime.timedelta(seconds=crnt + seconds[i]))
                 dur = str(datetime.timedelta(seconds=seconds[i]))
 
                 to_print += f"  {i + 1:02} {v} start={sta_g} local={sta} end={end} duration={dur}\n"
                 crnt += seconds[i]
-                crnt_glbl += seconds[i]
 
         return to_print.strip()
 
@@ -422,7 +479,7 @@ class IsoFileCore:
             return self._vob_files
 
         vob_files = [
-            f for f in sorted(self.mount_path.glob('*.[vV][oO][bB]')) if f.stem != 'VIDEO_TS'
+            f for f in _scan_dir(self.mount_path, '.vob') if f.stem != 'VIDEO_TS'
         ]
 
         if not len(vob_files):
@@ -437,9 +494,7 @@ class IsoFileCore:
         if self._ifo_files is not None:
             return self._ifo_files
 
-        ifo_files = [
-            f for f in sorted(self.mount_path.glob('*.[iI][fF][oO]'))
-        ]
+        ifo_files = _scan_dir(self.mount_path, '.ifo')
 
         if not len(ifo_files):
             raise FileNotFoundError('IsoFile: No IFOs found!')
@@ -75,10 +75,8 @@ class IFOX:
         reader._goto_sector_ptr(0x00E4)
         end, = reader._unpack_byte(4)
 
-        self.vts_vobu_admap = []
         cnt = (end + 1 - 4) // 4
-        for _ in range(cnt):
-            self.vts_vobu_admap += [reader._unpack_byte(4)[0]]
+        self.vts_vobu_admap = list(reader._unpack_byte(4, repeat=cnt))
 
     def _vts_ptt_srpt(self, reader: SectorReadHelper) -> None:
         reader._goto_sector_ptr(0x00C8)
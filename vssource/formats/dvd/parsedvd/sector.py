@@ -17,19 +17,16 @@ class SectorReadHelper:
     file: SPath | None = None
 
     def __init__(self, ifo: bytes | SPathLike | BufferedReader) -> None:
+        if not isinstance(ifo, (bytes, BufferedReader)):
+            self.file = SPath(ifo)
+            # IFOs are small and parsed with lots of tiny reads, so slurp them once instead of hitting the disc
+            ifo = self.file.read_bytes()
+
         if isinstance(ifo, bytes):
             ifo = BufferedReader(BytesIO(ifo))  # type: ignore
 
-        if not isinstance(ifo, BufferedReader):
-            self.file = SPath(ifo)
-            ifo = self.file.open('rb')
-
         self.ifo = ifo
 
-    def __del__(self) -> None:
-        if self.file is not None and self.ifo and not self.ifo.closed:
-            self.ifo.close()
-
     def _goto_sector_ptr(self, pos: int) -> None:
         self.ifo.seek(pos, os.SEEK_SET)
 
@@ -37,6 +34,9 @@ class SectorReadHelper:
 
         self.ifo.seek(ptr * 2048, os.SEEK_SET)
 
+    def _skip_bytes(self, n: int) -> None:
+        self.ifo.seek(n, os.SEEK_CUR)
+
     def _seek_unpack_byte(self, addr: int, *n: int) -> tuple[int, ...]:
         self.ifo.seek(addr, os.SEEK_SET)
         return self._unpack_byte(*n)
@@ -86,7 +86,8 @@ class VTSPgci:
             reader.ifo.seek(pgc_base, os.SEEK_SET)
 
             _, num_programs, num_cells = reader._unpack_byte(2, 1, 1)
-            reader._unpack_byte(4, 4)
+            # playback time, prohibited user ops
+            reader._skip_bytes(4 + 4)
 
             for _ in range(8):
                 ac, _ = reader._unpack_byte(1, 1)
@@ -96,13 +97,13 @@ class VTSPgci:
 
                 audio_control.append(AudioControl(available=available, number=number))
 
-            reader._unpack_byte(4, repeat=32)
+            # subpicture stream control
+            reader._skip_bytes(4 * 32)
 
             next_pgcn, prev_pgcn, group_pgcn = reader._unpack_byte(2, 2, 2)
 
-            reader._unpack_byte(1, 1)
-
-            reader._unpack_byte(4, repeat=16)
+            # playback mode, still time, color lookup table
+            reader._skip_bytes(1 + 1 + 4 * 16)
 
             _, offset_program, offset_playback, offset_position = reader._unpack_byte(2, 2, 2, 2)
 
@@ -18,6 +18,38 @@ __all__ = [
 ]
 
 
+def _compute_splits(chapters: list[int], splits: list[int]) -> tuple[list[list[int]], list[tuple[int, int]]]:
+    out = list[list[int]]()
+
+    rebase = chapters[0]  # normally 0
+    chaps = list[int]()
+
+    for i, a in enumerate(chapters):
+        chaps.append(a - rebase)
+
+        if (i + 1) in splits:
+            rebase = a
+
+            out.append(chaps)
+            chaps = [0]
+
+    if len(chaps) >= 1:
+        out.append(chaps)
+
+    assert len(out) == len(splits) + 1
+
+    fromy = 1
+    from_to_s = list[tuple[int, int]]()
+
+    for j in splits:
+        from_to_s.append((fromy, j - 1))
+        fromy = j
+
+    from_to_s.append((fromy, len(chapters) - 1))
+
+    return out, from_to_s
+
+
 @dataclass
 class SplitTitle:
     # maybe just return None instead of a SplitTitle with video None
@@ -72,7 +104,7 @@ class TitleAudios(vs_object, list[vs.AudioNode]):
     def __init__(self, title: Title) -> None:
         self.title = title
 
-        self.cache = dict[int, vs.AudioNode | None]({i: None for i in range(len(self.title._audios))})
+        self.cache = dict[int, vs.AudioNode]()
 
     @overload
     def __getitem__(self, idx: SupportsIndex, /) -> vs.AudioNode:
@@ -90,10 +122,10 @@ class TitleAudios(vs_object, list[vs.AudioNode]):
 
         i = int(key)
 
-        if i not in self.cache:
+        if not 0 <= i < len(self):
             raise KeyError
 
-        if (_anode := self.cache[i]):
+        if (_anode := self.cache.get(i)):
             return _anode
 
         asd = self.title._audios[i]
@@ -134,7 +166,7 @@ class TitleAudios(vs_object, list[vs.AudioNode]):
         return anode
 
     def __len__(self) -> int:
-        return len(self.cache)
+        return len(self.title._audios)
 
     def __iter__(self) -> Iterator[vs.AudioNode]:
         return (self[i] for i in range(len(self)))
@@ -175,18 +207,20 @@ class Title:
 
     def split_at(self, splits: list[int], audio: int | list[int] | None = None) -> tuple[SplitTitle, ...]:
         # Check if chapters are still valid, user is allowed to manipulated them
+        num_frames = self.video.num_frames
         last_chpt = -1
         for a in self.chapters:
             if a < 0:
                 raise CustomValueError(f'Negative chapter point {a}', self.split_at)
             if a <= last_chpt:
                 raise CustomValueError(f'Chapter must be monotonly increasing {a} before {last_chpt}', self.split_at)
-            if a > len(self.video):
+            if a > num_frames:
                 raise CustomValueError('Chapter must not be higher than video length', self.split_at)
             last_chpt = a
         output_cnt = SplitHelper._sanitize_splits(self, splits)
         video = SplitHelper.split_video(self, splits)
-        chapters = SplitHelper.split_chapters(self, splits)
+
+        chapters, from_to_s = _compute_splits(self.chapters, splits)
 
         audios: list[list[vs.AudioNode]]
 
@@ -201,15 +235,6 @@ class Title:
         else:
             audios = [[]] * output_cnt
 
-        fromy = 1
-        from_to_s = list[tuple[int, int]]()
-
-        for j in splits:
-            from_to_s.append((fromy, j - 1))
-            fromy = j
-
-        from_to_s.append((fromy, len(self.chapters) - 1))
-
         return tuple(
             SplitTitle(v, a, c, self, f) for v, a, c, f in zip(video, audios, chapters, from_to_s)
         )
@@ -349,26 +374,7 @@ class SplitHelper:
 
     @staticmethod
     def split_chapters(title: Title, splits: list[int]) -> list[list[int]]:
-        out = list[list[int]]()
-
-        rebase = title.chapters[0]  # normally 0
-        chaps = list[int]()
-
-        for i, a in enumerate(title.chapters):
-            chaps.append(a - rebase)
-
-            if (i + 1) in splits:
-                rebase = a
-
-                out.append(chaps)
-                chaps = [0]
-
-        if len(chaps) >= 1:
-            out.append(chaps)
-
-        assert len(out) == len(splits) + 1
-
-        return out
+        return _compute_splits(title.chapters, splits)[0]
 
     @staticmethod
     def split_video(title: Title, splits: list[int]) -> tuple[vs.VideoNode, ...]:
@@ -387,12 +393,13 @@ class SplitHelper:
         assert isinstance(splits, list)
 
         lasta = -1
+        num_chapters = len(title.chapters)
 
         for a in splits:
             assert isinstance(a, int)
             if not (a > lasta):
                 raise CustomValueError('Chapter splits are not ordered correctly!', SplitHelper._sanitize_splits)
-            if not (a <= len(title.chapters)):
+            if not (a <= num_chapters):
                 raise CustomValueError('Chapter split is out of bounds!', SplitHelper._sanitize_splits)
 
             lasta = a
@@ -401,16 +408,10 @@ class SplitHelper:
 
     @staticmethod
     def _cut_split(title: Title, splits: list[int], a: T, b: Callable[[Title, T, int, int], T]) -> tuple[T, ...]:
-        out, last = list[T](), 0
-
-        for s in splits:
-            index = s - 1
-            out.append(b(title, a, last, index))
-            last = index
-
-        out.append(b(title, a, last, len(title.chapters) - 1))
+        ends = [s - 1 for s in splits] + [len(title.chapters) - 1]
+        starts = [0, *ends[:-1]]
 
-        return tuple(out)
+        return tuple(b(title, a, start, end) for start, end in zip(starts, ends))
 
     @staticmethod
     def _cut_fz_v(title: Title, vnode: vs.VideoNode, f: int, t: int) -> Optional[vs.VideoNode]:
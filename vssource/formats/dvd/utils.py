@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import subprocess
+from itertools import accumulate
 from typing import Sequence, SupportsFloat
 
 from vstools import SupportsString
@@ -33,9 +34,4 @@ def double_check_dvdnav(iso: SupportsString, title: int) -> list[float] | None:
 
 
 def absolute_time_from_timecode(timecodes: Sequence[SupportsFloat]) -> list[float]:
-    absolutetime = list[float]([0.0])
-
-    for i, a in enumerate(timecodes):
-        absolutetime.append(absolutetime[i] + float(a))
-
-    return absolutetime
+    return list(accumulate(map(float, timecodes), initial=0.0))
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import re
 from fractions import Fraction
-from functools import lru_cache, partial
-from typing import TYPE_CHECKING, Sequence
+from functools import partial
+from typing import TYPE_CHECKING, Sequence, cast
 
 from vstools import CustomValueError, SPath, core, remap_frames, vs
 
@@ -53,8 +53,10 @@ class D2VWitch(DVDExtIndexer):
         with open(index_path, 'w') as file:
             file.write('\n'.join(lines))
 
-    @lru_cache
     def get_info(self, index_path: SPath, file_idx: int = -1) -> D2VIndexFileInfo:
+        if (cache_key := (index_path, file_idx)) in self._info_cache:
+            return cast(D2VIndexFileInfo, self._info_cache[cache_key])
+
         with open(index_path, 'r') as f:
             file_content = f.read()
 
@@ -136,13 +138,19 @@ class D2VWitch(DVDExtIndexer):
                     list(int(a, 16) for a in line[7:])
                 ))
 
-        return D2VIndexFileInfo(index_path, file_idx, header, frame_data)
+        index_info = self._info_cache[cache_key] = D2VIndexFileInfo(index_path, file_idx, header, frame_data)
+
+        return index_info
 
     def parse_vts(
         self, title: IFO0Title, disable_rff: bool, vobidcellids_to_take: list[tuple[int, int]],
         target_vts: IFOX, output_folder: SPath, vob_input_files: Sequence[SPath]
     ) -> tuple[vs.VideoNode, list[int], list[tuple[int, int]], list[int]]:
-        dvddd = self._d2v_vobid_frameset(vob_input_files, output_folder)
+        index_file = self.index(vob_input_files, output_folder=output_folder)[0]
+
+        fflags, vobids, progseq = self._d2v_collect_all_frameflags(index_file)
+
+        dvddd = self._d2v_vobid_frameset(vobids)
 
         if len(dvddd.keys()) == 1 and (0, 0) in dvddd.keys():
             raise CustomValueError(
@@ -152,9 +160,6 @@ class D2VWitch(DVDExtIndexer):
 
         frameranges = [x for y in [dvddd[a] for a in vobidcellids_to_take] for x in y]
 
-        fflags, vobids, progseq = self._d2v_collect_all_frameflags(vob_input_files, output_folder)
-
-        index_file = self.index(vob_input_files, output_folder=output_folder)[0]
         node = self._source_func(index_file, rff=False)  # type: ignore
 
         assert len(node) == len(fflags) == len(vobids) == len(progseq)
@@ -176,9 +181,8 @@ class D2VWitch(DVDExtIndexer):
         return node, rff, vobids, []
 
     def _d2v_collect_all_frameflags(
-        self, files: Sequence[SPath], output_folder: SPath
+        self, index_file: SPath
     ) -> tuple[list[int], list[tuple[int, int]], list[int]]:
-        index_file = self.index(files, output_folder=output_folder)[0]
         index_info = self.get_info(index_file)
 
         frameflagslst = list[int]()
@@ -201,21 +205,15 @@ class D2VWitch(DVDExtIndexer):
         return frameflagslst, vobidlst, progseqlst
 
     def _d2v_vobid_frameset(
-        self, files: Sequence[SPath], output_folder: SPath
+        self, vobids: Sequence[tuple[int, int]]
     ) -> dict[tuple[int, int], list[tuple[int, int]]]:
-        _, vobids, _ = self._d2v_collect_all_frameflags(files, output_folder)
-
         vobidset = dict[tuple[int, int], list[tuple[int, int]]]()
-        for i, a in enumerate(vobids):
-            if a not in vobidset:
-                vobidset[a] = [(i, i - 1)]
-
-            last = vobidset[a][-1]
-
-            if last[1] + 1 == i:
-                vobidset[a][-1] = (last[0], last[1] + 1)
-                continue
 
-            vobidset[a].append((i, i))
+        # track where the current run of the same vobid started and store it once it ends
+        start = 0
+        for i in range(1, len(vobids) + 1):
+            if i == len(vobids) or vobids[i] != vobids[start]:
+                vobidset.setdefault(vobids[start], []).append((start, i - 1))
+                start = i
 
         return vobidset
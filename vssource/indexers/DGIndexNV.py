@@ -2,8 +2,7 @@ from __future__ import annotations
 
 import os
 from fractions import Fraction
-from functools import lru_cache
-from typing import Sequence
+from typing import Sequence, cast
 
 from vstools import SPath, core
 
@@ -61,8 +60,10 @@ class DGIndexNV(ExternalIndexer):
 
         index_path.write_lines(lines)
 
-    @lru_cache
     def get_info(self, index_path: SPath, file_idx: int = -1) -> DGIndexFileInfo:
+        if (cache_key := (index_path, file_idx)) in self._info_cache:
+            return cast(DGIndexFileInfo, self._info_cache[cache_key])
+
         with open(index_path, 'r') as file:
             file_content = file.read()
 
@@ -164,4 +165,6 @@ class DGIndexNV(ExternalIndexer):
 
                     footer[key] = value
 
-        return DGIndexFileInfo(index_path, file_idx, header, frame_data, footer)
+        index_info = self._info_cache[cache_key] = DGIndexFileInfo(index_path, file_idx, header, frame_data, footer)
+
+        return index_info
@@ -139,6 +139,8 @@ class ExternalIndexer(Indexer):
         self.ext = ext
         self.default_out_folder = default_out_folder
 
+        self._info_cache = dict[tuple[SPath, int], IndexFileType]()
+
     @abstractmethod
     def get_cmd(self, files: list[SPath], output: SPath) -> list[str]:
         """Returns the indexer command"""
@@ -36,14 +36,13 @@ class DVDSRCIndexer(DVDIndexer):
             x for a in vobidcellids_to_take for x in get_sectorranges_for_vobcellpair(target_vts, a)
         ]
 
+        # first index of every VOBU sector, so each range is a lookup instead of a scan over the whole admap
+        admap_idx = {sector: i for i, sector in reversed(list(enumerate(admap)))}
+
         vts_indices = list[int]()
         for a in all_ranges:
-            start_index = admap.index(a[0])
-
-            try:
-                end_index = admap.index(a[1] + 1) - 1
-            except ValueError:
-                end_index = len(admap) - 1
+            start_index = admap_idx[a[0]]
+            end_index = admap_idx.get(a[1] + 1, len(admap)) - 1
 
             vts_indices.extend([start_index, end_index])
 
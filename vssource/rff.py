@@ -110,31 +110,27 @@ def apply_rff_video(
 
     woven = final.std.DoubleWeave()[::2]
 
-    def _set_repeat(n: int, f: vs.VideoFrame) -> vs.VideoFrame:
-        f = f.copy()
-        if fields[n * 2]['repeat']:
-            f.props['RepeatedField'] = 1
-        elif fields[n * 2 + 1]['repeat']:
-            f.props['RepeatedField'] = 0
-        else:
-            f.props['RepeatedField'] = -1
-        return f
-
-    woven = woven.std.ModifyFrame(woven, _set_repeat)
-
-    # TODO: this seems to not work or atleast useless since its disable for non progressive sequence which is rare
-    def _update_progressive(n: int, f: vs.VideoFrame) -> vs.VideoFrame:
+    # both props are set in one pass so there's only one extra node and frame copy
+    def _set_repeat_progressive(n: int, f: vs.VideoFrame) -> vs.VideoFrame:
         fout = f.copy()
 
         tf = fields[n * 2]
         bf = fields[n * 2 + 1]
 
+        if tf['repeat']:
+            fout.props['RepeatedField'] = 1
+        elif bf['repeat']:
+            fout.props['RepeatedField'] = 0
+        else:
+            fout.props['RepeatedField'] = -1
+
+        # TODO: this seems to not work or atleast useless since its disable for non progressive sequence which is rare
         if tf['prg'] and bf['prg']:
             fout.props['_FieldBased'] = 0
 
         return fout
 
-    return woven.std.ModifyFrame(woven, _update_progressive)
+    return woven.std.ModifyFrame(woven, _set_repeat_progressive)
 
 
 def cut_array_on_ranges(array: list[T], ranges: list[tuple[int, int]]) -> list[T]: